@@ -12,19 +12,45 @@ Uso:
 
 import re
 import unicodedata
-from asyncio import Semaphore, gather, run as asyncio_run
+from asyncio import Semaphore, gather, get_running_loop, run as asyncio_run
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from logging import getLogger
+from threading import Lock
+from time import sleep, time
+from typing import Any, Callable, NamedTuple, TypeVar
+from urllib.error import HTTPError, URLError
 
+from diskcache import Cache
 from requests import get as requests_get
 from tcgdexsdk import TCGdex
 
+from poke_merkdo.config import (
+    CACHE_EXPIRY_DAYS,
+    NOT_FOUND_EXPIRY_DAYS,
+    SET_MAPPING_EXPIRY_DAYS,
+    TCGDEX_CACHE_DIR,
+)
 from poke_merkdo.models.card import Card
 
 logger = getLogger(__name__)
 
+T = TypeVar("T")
+
 TCGDEX_SETS_URL = "https://api.tcgdex.net/v2/en/sets"
+SETS_CACHE_KEY = "tcgdex_sets_v2"
+
+DAY_SECONDS = 24 * 60 * 60
+
+DEFAULT_MAX_CONCURRENT = 64
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 0.5
 
+_RE_NON_ALNUM = re.compile(r"[^a-z0-9\s]")
+_RE_WHITESPACE = re.compile(r"\s+")
 
+
+@lru_cache(maxsize=2048)
 def normalize_set_name(name: str) -> str:
     """
     Normaliza un nombre de set para comparación determinística.
@@ -37,6 +63,9 @@ def normalize_set_name(name: str) -> str:
     5. Colapsa espacios múltiples
     6. Elimina espacios al inicio/final
 
+    Los resultados se memorizan: los mismos nombres de set se repiten en
+    todo el CSV y en los aliases.
+
     Args:
         name: Nombre del set a normalizar
 
@@ -48,8 +77,9 @@ def normalize_set_name(name: str) -> str:
 
     normalized = name.lower()
 
-    normalized = unicodedata.normalize("NFKD", normalized)
-    normalized = normalized.encode("ascii", "ignore").decode("ascii")
+    if not normalized.isascii():
+        normalized = unicodedata.normalize("NFKD", normalized)
+        normalized = normalized.encode("ascii", "ignore").decode("ascii")
 
     prefixes_to_remove = ["pokemon ", "pokmon "]
     for prefix in prefixes_to_remove:
@@ -57,28 +87,78 @@ def normalize_set_name(name: str) -> str:
             normalized = normalized[len(prefix) :]
             break
 
-    normalized = re.sub(r"[^a-z0-9\s]", "", normalized)
+    normalized = _RE_NON_ALNUM.sub("", normalized)
 
-    normalized = re.sub(r"\s+", " ", normalized).strip()
+    normalized = _RE_WHITESPACE.sub(" ", normalized).strip()
 
     return normalized
 
 
+_MISS = object()
+
+
+class CachedCard(NamedTuple):
+    """Datos de una carta de TCGdex que se usan (y se guardan en disco)."""
+
+    name: str
+    image_url: str | None
+
+
+def _as_sets_list(data: object) -> list[dict[str, Any]]:
+    """
+    Valida que la lista de sets tenga la forma esperada.
+
+    Args:
+        data: Lista de sets (respuesta de la API o copia en disco)
+
+    Returns:
+        La misma lista, tipada como lista de objetos
+
+    Raises:
+        ValueError: Si no es una lista de objetos JSON
+    """
+    if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+        raise ValueError("Unexpected TCGdex set list format")
+    return data
+
+
+def _local_id_key(local_id: str) -> str:
+    """Clave para comparar números de carta ("001" y "1" son la misma)."""
+    return local_id.strip().lower().lstrip("0") or "0"
+
+
+def _is_energy(card: Card) -> bool:
+    """Energías básicas y cartas de sets de energía (no se buscan en TCGdex)."""
+    card_name = card.card_name_lc
+    if "basic" in card_name and "energy" in card_name:
+        return True
+    return "energy" in card.console_name_lc
+
+
 class SetMappingCache:
     """
     Cache para el mapping dinámico de sets desde TCGdex API.
 
     Singleton que mantiene el mapping {normalized_name: set_id} en memoria.
-    Se inicializa una sola vez al primer uso.
+    Se inicializa una sola vez al primer uso; la lista de sets de la API se
+    guarda en disco junto con su ETag. Pasados SET_MAPPING_EXPIRY_DAYS días
+    se revalida con If-None-Match: si no cambió, la API responde 304 sin
+    cuerpo y se reutiliza la copia en disco.
+
+    Es seguro usarlo desde varios hilos: la carga está protegida por un lock,
+    así que solo el primer llamador hace la petición HTTP.
     """
 
     _instance: "SetMappingCache | None" = None
     _mapping: dict[str, str] | None = None
     _reverse_mapping: dict[str, str] | None = None
+    _load_lock = Lock()
 
     def __new__(cls) -> "SetMappingCache":
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._load_lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
     def get_mapping(self) -> dict[str, str]:
@@ -89,7 +169,9 @@ class SetMappingCache:
             Dict {normalized_name: set_id}
         """
         if self._mapping is None:
-            self._load_mapping()
+            with self._load_lock:
+                if self._mapping is None:
+                    self._load_mapping()
         return self._mapping or {}
 
     def get_reverse_mapping(self) -> dict[str, str]:
@@ -100,20 +182,23 @@ class SetMappingCache:
             Dict {set_id: original_name}
         """
         if self._reverse_mapping is None:
-            self._load_mapping()
+            with self._load_lock:
+                if self._reverse_mapping is None:
+                    self._load_mapping()
         return self._reverse_mapping or {}
 
     def _load_mapping(self) -> None:
-        """Carga el mapping desde la API de TCGdex."""
-        self._mapping = {}
-        self._reverse_mapping = {}
+        """
+        Carga el mapping desde la API de TCGdex.
 
-        try:
-            logger.info("Loading set mapping from TCGdex API...")
-            response = requests_get(TCGDEX_SETS_URL, timeout=10)
-            response.raise_for_status()
+        Los dicts se construyen completos antes de publicarlos, para que
+        otro hilo nunca vea un mapping a medio llenar.
+        """
+        mapping: dict[str, str] = {}
+        reverse_mapping: dict[str, str] = {}
 
-            sets_data = response.json()
+        try:
+            sets_data = self._load_sets_data()
 
             for set_info in sets_data:
                 set_id = set_info.get("id", "")
@@ -123,22 +208,63 @@ class SetMappingCache:
                     continue
 
                 normalized = normalize_set_name(set_name)
-                self._mapping[normalized] = set_id
-                self._reverse_mapping[set_id] = set_name
+                mapping[normalized] = set_id
+                reverse_mapping[set_id] = set_name
 
-            self._add_common_aliases()
+            self._add_common_aliases(mapping)
 
-            logger.info(f"Loaded {len(self._mapping)} sets from TCGdex API")
+            self._reverse_mapping = reverse_mapping
+            self._mapping = mapping
+            logger.info(f"Loaded {len(mapping)} sets from TCGdex API")
 
         except Exception as e:
             logger.warning(f"Failed to load sets from API: {e}")
             self._load_fallback_mapping()
 
-    def _add_common_aliases(self) -> None:
-        """Agrega aliases comunes que no están en la API."""
-        if self._mapping is None:
-            return
+    def _load_sets_data(self) -> list[dict[str, Any]]:
+        """
+        Obtiene la lista de sets, desde disco o revalidando con la API.
 
+        Returns:
+            Lista de sets tal como la devuelve la API
+        """
+        with Cache(str(TCGDEX_CACHE_DIR)) as disk_cache:
+            entry = disk_cache.get(SETS_CACHE_KEY)
+            if not isinstance(entry, dict):
+                entry = None
+            max_age = SET_MAPPING_EXPIRY_DAYS * DAY_SECONDS
+            if entry is not None and time() - entry["fetched_at"] < max_age:
+                return _as_sets_list(entry["sets"])
+
+            headers = {}
+            if entry is not None and entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+
+            logger.info("Loading set mapping from TCGdex API...")
+            try:
+                response = requests_get(TCGDEX_SETS_URL, headers=headers, timeout=10)
+                if response.status_code == 304 and entry is not None:
+                    logger.info("Set list unchanged upstream (304)")
+                    sets_data = _as_sets_list(entry["sets"])
+                    etag = entry["etag"]
+                else:
+                    response.raise_for_status()
+                    sets_data = _as_sets_list(response.json())
+                    etag = response.headers.get("ETag")
+            except Exception as e:
+                if entry is None:
+                    raise
+                logger.warning(f"Could not revalidate sets, using stale copy: {e}")
+                return _as_sets_list(entry["sets"])
+
+            disk_cache.set(
+                SETS_CACHE_KEY,
+                {"etag": etag, "sets": sets_data, "fetched_at": time()},
+            )
+            return sets_data
+
+    def _add_common_aliases(self, mapping: dict[str, str]) -> None:
+        """Agrega aliases comunes que no están en la API."""
         aliases = {
             "promo": "svp",
             "black star promo": "svp",
@@ -153,8 +279,8 @@ class SetMappingCache:
 
         for alias, set_id in aliases.items():
             normalized = normalize_set_name(alias)
-            if normalized not in self._mapping:
-                self._mapping[normalized] = set_id
+            if normalized not in mapping:
+                mapping[normalized] = set_id
 
     def _load_fallback_mapping(self) -> None:
         """Mapping de fallback si la API falla."""
@@ -196,14 +322,17 @@ class SetMappingCache:
             "silver tempest": "swsh12",
             "crown zenith": "swsh12.5",
         }
-        self._mapping = fallback
         self._reverse_mapping = {v: k for k, v in fallback.items()}
+        self._mapping = fallback
 
     def refresh(self) -> None:
-        """Fuerza una recarga del mapping desde la API."""
-        self._mapping = None
-        self._reverse_mapping = None
-        self._load_mapping()
+        """Fuerza una revalidación del mapping con la API."""
+        with Cache(str(TCGDEX_CACHE_DIR)) as disk_cache:
+            entry = disk_cache.get(SETS_CACHE_KEY)
+            if entry is not None:
+                disk_cache.set(SETS_CACHE_KEY, {**entry, "fetched_at": 0.0})
+        with self._load_lock:
+            self._load_mapping()
 
 
 class TCGdexEnricher:
@@ -213,10 +342,20 @@ class TCGdexEnricher:
     Características:
     - Carga automática de sets desde la API de TCGdex
     - Normalización robusta de nombres de sets
-    - Cache en memoria para evitar llamadas repetidas
+    - Cache en disco de cartas (incluidas las no encontradas) entre ejecuciones
     - Fallback a mapping estático si la API falla
     """
 
+    __slots__ = (
+        "tcgdex",
+        "language",
+        "_card_cache",
+        "_set_cache",
+        "_set_index",
+        "_resolved_sets",
+        "_executor",
+    )
+
     def __init__(self, language: str = "en"):
         """
         Inicializa el enricher.
@@ -225,17 +364,41 @@ class TCGdexEnricher:
             language: Idioma para TCGdex ("en", "es", "fr", etc.)
         """
         self.tcgdex = TCGdex(language)
-        self._card_cache: dict[str, object] = {}
+        self.language = language
+        self._card_cache = Cache(str(TCGDEX_CACHE_DIR))
         self._set_cache = SetMappingCache()
+        self._set_index: dict[str, dict[str, object]] = {}
+        self._resolved_sets: dict[str, str | None] = {}
+        self._executor: ThreadPoolExecutor | None = None
         logger.info(f"TCGdexEnricher initialized (language: {language})")
 
     def _resolve_set_id(self, set_name: str) -> str | None:
         """
         Resuelve el ID del set a partir del nombre del CSV.
 
+        El resultado se memoriza por nombre: un CSV repite el mismo set en
+        muchas cartas, así que la búsqueda corre una sola vez por set.
+
+        Args:
+            set_name: Nombre del set desde el CSV (ej: "Pokemon Journey Together")
+
+        Returns:
+            ID del set para TCGdex (ej: "sv09") o None si no se encuentra
+        """
+        if set_name not in self._resolved_sets:
+            self._resolved_sets[set_name] = self._match_set_id(set_name)
+        return self._resolved_sets[set_name]
+
+    def _match_set_id(self, set_name: str) -> str | None:
+        """
+        Busca el ID del set en el mapping de TCGdex.
+
         Estrategia de búsqueda (en orden):
         1. Match exacto con nombre normalizado
         2. Match parcial (nombre normalizado contenido en el set name)
+        3. Match parcial inverso (el set name contenido en el nombre)
+
+        Ambos matches parciales se buscan en una sola pasada por el mapping.
 
         Args:
             set_name: Nombre del set desde el CSV (ej: "Pokemon Journey Together")
@@ -254,15 +417,17 @@ class TCGdexEnricher:
             logger.debug(f"Exact match: '{set_name}' -> '{set_id}'")
             return set_id
 
+        reverse_match = None
         for normalized_name, set_id in mapping.items():
             if normalized_name in normalized_input:
                 logger.debug(f"Partial match: '{set_name}' -> '{set_id}'")
                 return set_id
+            if reverse_match is None and normalized_input in normalized_name:
+                reverse_match = set_id
 
-        for normalized_name, set_id in mapping.items():
-            if normalized_input in normalized_name:
-                logger.debug(f"Reverse partial match: '{set_name}' -> '{set_id}'")
-                return set_id
+        if reverse_match is not None:
+            logger.debug(f"Reverse partial match: '{set_name}' -> '{reverse_match}'")
+            return reverse_match
 
         logger.debug(
             f"No mapping found for set: '{set_name}' (normalized: '{normalized_input}')"
@@ -286,81 +451,238 @@ class TCGdexEnricher:
             logger.debug(f"Skipping {card.card_name}: already has image")
             return True
 
-        if "basic" in card.card_name.lower() and "energy" in card.card_name.lower():
-            logger.debug(f"Skipping basic energy: {card.card_name}")
+        if _is_energy(card):
+            logger.debug(f"Skipping energy card: {card.card_name}")
             return False
 
-        if "energy" in card.console_name.lower():
-            logger.debug(f"Skipping energy set card: {card.card_name}")
-            return False
+        return await self._enrich_resolved(card, self._card_ids(card))
+
+    async def _enrich_resolved(
+        self, card: Card, ids: tuple[str, str, str] | None
+    ) -> bool:
+        """
+        Enriquece una carta cuyo ID de TCGdex ya fue calculado.
 
+        Args:
+            card: Carta a enriquecer
+            ids: Resultado de _card_ids para esta carta
+
+        Returns:
+            True si se enriqueció exitosamente
+        """
         try:
-            set_id = self._resolve_set_id(card.console_name)
-            if not set_id or not card.card_number:
+            if ids is None:
                 logger.debug(f"Cannot determine card ID for {card.card_name}")
                 return False
-
-            try:
-                card_num = int(card.card_number)
-                formatted_num = f"{card_num:03d}"
-            except ValueError:
-                formatted_num = card.card_number
-
-            card_id = f"{set_id}-{formatted_num}"
-
-            if card_id in self._card_cache:
-                logger.debug(f"Cache hit: {card_id}")
-                self._apply_data(card, self._card_cache[card_id])
-                return True
-
-            logger.debug(f"Fetching {card_id} from TCGdex...")
-            tcg_card = await self.tcgdex.card.get(card_id)
-
-            if tcg_card:
-                tcg_name = tcg_card.name if hasattr(tcg_card, "name") else ""
-                csv_name = card.card_name.split()[0].lower()
-                if csv_name not in tcg_name.lower():
-                    logger.debug(
-                        f"Name mismatch: {card.card_name} != {tcg_name}, skipping"
+            set_id, card_id, local_key = ids
+            cache_key = self._cache_key(card_id)
+
+            cached = self._card_cache.get(cache_key, default=_MISS)
+            if cached is _MISS:
+                tcg_card = self._set_index.get(set_id, {}).get(local_key)
+                if tcg_card is None:
+                    logger.debug(f"Fetching {card_id} from TCGdex...")
+                    tcg_card = await get_running_loop().run_in_executor(
+                        self._executor, self._fetch_card, card_id
                     )
-                    return False
-
-                self._card_cache[card_id] = tcg_card
-                self._apply_data(card, tcg_card)
-                logger.info(f"Card enriched: {card_id} -> {card.card_name}")
-                return True
+                cached = self._to_cached_card(tcg_card) if tcg_card else None
+                expire_days = CACHE_EXPIRY_DAYS if cached else NOT_FOUND_EXPIRY_DAYS
+                self._card_cache.set(
+                    cache_key, cached, expire=expire_days * DAY_SECONDS
+                )
             else:
+                logger.debug(f"Cache hit: {card_id}")
+
+            if cached is None:
                 logger.debug(f"Card not found: {card_id}")
                 return False
 
+            csv_name = card.card_name.split()[0].lower()
+            if csv_name not in cached.name.lower():
+                logger.debug(
+                    f"Name mismatch: {card.card_name} != {cached.name}, skipping"
+                )
+                return False
+
+            self._apply_data(card, cached)
+            logger.info(f"Card enriched: {card_id} -> {card.card_name}")
+            return True
+
         except Exception as e:
             logger.debug(f"Error enriching {card.card_name}: {e}")
             return False
 
-    def _apply_data(self, card: Card, tcg_card: object) -> None:
+    def _card_ids(self, card: Card) -> tuple[str, str, str] | None:
+        """
+        Construye el ID de TCGdex de una carta (set + número).
+
+        Args:
+            card: Carta del CSV
+
+        Returns:
+            Tupla (set_id, card_id, clave local en el set) o None si no se
+            puede determinar
+        """
+        set_id = self._resolve_set_id(card.console_name)
+        card_number = card.card_number
+        if not set_id or not card_number:
+            return None
+
+        try:
+            card_num = int(card_number)
+            formatted_num = f"{card_num:03d}"
+        except ValueError:
+            formatted_num = card_number
+
+        return set_id, f"{set_id}-{formatted_num}", _local_id_key(card_number)
+
+    def _cache_key(self, card_id: str) -> str:
+        """Clave de la carta en el cache en disco (depende del idioma)."""
+        return f"card_v2_{self.language}_{card_id}"
+
+    def _fetch_card(self, card_id: str) -> object | None:
+        """
+        Descarga una carta individual con el SDK.
+
+        Args:
+            card_id: ID de la carta en TCGdex (ej: "sv09-001")
+
+        Returns:
+            Carta del SDK o None si no existe (404)
+        """
+        return self._fetch_with_retries(self.tcgdex.card.getSync, card_id)
+
+    def _fetch_set(self, set_id: str) -> object | None:
+        """
+        Descarga un set completo (incluye el resumen de todas sus cartas).
+
+        Args:
+            set_id: ID del set en TCGdex (ej: "sv09")
+
+        Returns:
+            Set del SDK o None si no existe (404)
+        """
+        return self._fetch_with_retries(self.tcgdex.set.getSync, set_id)
+
+    def _fetch_with_retries(
+        self, fetch: Callable[[str], T | None], item_id: str
+    ) -> T | None:
+        """
+        Consulta un endpoint del SDK, reintentando con backoff exponencial.
+
+        El SDK hace la petición HTTP de forma bloqueante, por eso se ejecuta
+        en un hilo del pool en lugar de en el event loop.
+
+        Args:
+            fetch: Método getSync del endpoint del SDK (cards, sets, ...)
+            item_id: ID del recurso a consultar
+
+        Returns:
+            Recurso del SDK o None si no existe (404)
+        """
+        error: Exception | None = None
+        for attempt in range(MAX_RETRIES):
+            try:
+                return fetch(item_id)
+            except HTTPError as e:
+                if e.code == 404:
+                    return None
+                error = e
+            except URLError as e:
+                error = e
+            if attempt < MAX_RETRIES - 1:
+                delay = RETRY_BACKOFF_SECONDS * 2**attempt
+                logger.debug(f"Retrying {item_id} in {delay:.1f}s: {error}")
+                sleep(delay)
+        raise error or RuntimeError(f"Could not fetch {item_id}")
+
+    async def _load_set_indexes(
+        self, card_ids: list[tuple[str, str, str] | None]
+    ) -> None:
+        """
+        Descarga una sola vez cada set presente en las cartas.
+
+        Indexa las cartas de cada set por número, de modo que la mayoría de
+        las cartas se resuelven sin una petición individual.
+
+        Args:
+            card_ids: IDs (ver _card_ids) de las cartas a enriquecer
+        """
+        set_ids = set()
+        for ids in card_ids:
+            if ids and self._cache_key(ids[1]) not in self._card_cache:
+                set_ids.add(ids[0])
+
+        pending = sorted(set_id for set_id in set_ids if set_id not in self._set_index)
+        if not pending:
+            return
+
+        loop = get_running_loop()
+        results = await gather(
+            *(
+                loop.run_in_executor(self._executor, self._fetch_set, set_id)
+                for set_id in pending
+            ),
+            return_exceptions=True,
+        )
+
+        for set_id, tcg_set in zip(pending, results):
+            if isinstance(tcg_set, BaseException) or tcg_set is None:
+                logger.debug(f"Could not load set {set_id}: {tcg_set}")
+                continue
+            self._set_index[set_id] = {
+                _local_id_key(resume.localId): resume
+                for resume in getattr(tcg_set, "cards", None) or []
+            }
+            logger.debug(f"Indexed {len(self._set_index[set_id])} cards of {set_id}")
+
+    def _to_cached_card(self, tcg_card: object) -> CachedCard:
+        """
+        Reduce una carta del SDK a los campos que se usan.
+
+        Args:
+            tcg_card: Carta o resumen de carta del SDK
+
+        Returns:
+            CachedCard con el nombre y la URL final de la imagen
+        """
+        image = getattr(tcg_card, "image", None)
+        return CachedCard(
+            name=getattr(tcg_card, "name", "") or "",
+            image_url=f"{image}/high.png" if image else None,
+        )
+
+    def _apply_data(self, card: Card, cached: CachedCard) -> None:
         """
         Aplica los datos de TCGdex a la carta.
 
         Args:
             card: Carta destino
-            tcg_card: Datos de TCGdex
+            cached: Datos de TCGdex
         """
-        if hasattr(tcg_card, "image") and tcg_card.image:
-            card.image_url = f"{tcg_card.image}/high.png"
+        if cached.image_url:
+            card.image_url = cached.image_url
 
     async def enrich_cards(
         self,
         cards: list[Card],
         show_progress: bool = False,
-        max_concurrent: int = 20,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
     ) -> tuple[int, int, list[Card]]:
         """
         Enriquece múltiples cartas en paralelo.
 
+        Las cartas que ya tienen imagen o son energías se resuelven sin entrar
+        al pool. Para el resto, primero descarga cada set involucrado una sola
+        vez; luego se despachan a la vez con `gather` y solo las que no aparecen
+        en su set hacen una petición individual. El semáforo limita cuántas
+        consultas están en vuelo y las llamadas bloqueantes al SDK corren en
+        un pool de hilos del mismo tamaño.
+
         Args:
             cards: Lista de cartas
             show_progress: Mostrar progreso
-            max_concurrent: Máximo de requests concurrentes (default: 20)
+            max_concurrent: Máximo de requests concurrentes (default: 64)
 
         Returns:
             Tupla (encontradas, no encontradas, lista_no_encontradas)
@@ -368,22 +690,58 @@ class TCGdexEnricher:
         semaphore = Semaphore(max_concurrent)
         not_found_cards: list[Card] = []
 
-        async def enrich_with_semaphore(card: Card) -> bool:
+        results: list[bool | BaseException] = [bool(card.image_url) for card in cards]
+        work_indexes = [
+            i
+            for i, card in enumerate(cards)
+            if not card.image_url and not _is_energy(card)
+        ]
+        work = [cards[i] for i in work_indexes]
+        total = len(work)
+        done = 0
+
+        async def enrich_with_semaphore(
+            card: Card, ids: tuple[str, str, str] | None
+        ) -> bool:
+            nonlocal done
             async with semaphore:
-                return await self.enrich_card(card)
+                success = await self._enrich_resolved(card, ids)
+            done += 1
+            if show_progress:
+                logger.info(f"Enriched {done}/{total}: {card.card_name}")
+            return success
 
         if show_progress:
             logger.info(
-                f"Processing {len(cards)} cards (max {max_concurrent} concurrent)..."
+                f"Processing {total} cards (max {max_concurrent} concurrent)..."
             )
 
-        tasks = [enrich_with_semaphore(card) for card in cards]
-        results = await gather(*tasks)
+        with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+            self._executor = executor
+            try:
+                await get_running_loop().run_in_executor(
+                    executor, self._set_cache.get_mapping
+                )
+                work_ids = [self._card_ids(card) for card in work]
+                await self._load_set_indexes(work_ids)
+                tasks = [
+                    enrich_with_semaphore(card, ids)
+                    for card, ids in zip(work, work_ids)
+                ]
+                work_results = await gather(*tasks, return_exceptions=True)
+            finally:
+                self._executor = None
+
+        for i, success in zip(work_indexes, work_results):
+            results[i] = success
 
         found = 0
         not_found = 0
 
         for card, success in zip(cards, results):
+            if isinstance(success, BaseException):
+                logger.debug(f"Error enriching {card.card_name}: {success}")
+                success = False
             if success:
                 found += 1
             else:
@@ -398,7 +756,7 @@ async def enrich_cards_with_tcgdex(
     cards: list[Card],
     language: str = "en",
     show_progress: bool = False,
-    max_concurrent: int = 20,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
 ) -> tuple[int, int, list[Card]]:
     """
     Función async para enriquecer cartas con TCGdex.
@@ -422,7 +780,7 @@ def enrich_cards_sync(
     cards: list[Card],
     language: str = "en",
     show_progress: bool = False,
-    max_concurrent: int = 20,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
 ) -> tuple[int, int, list[Card]]:
     """
     Versión síncrona del enricher.
@@ -1,14 +1,30 @@
 """Image caching system"""
 
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from logging import getLogger
+from os import scandir
 from pathlib import Path
+from shutil import copyfileobj
 
 from diskcache import Cache
 from PIL.Image import Image as PILImage
+from PIL.Image import Resampling
 from PIL.Image import open as pil_open
-from requests import get as requests_get
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from poke_merkdo.config import CACHE_DIR, CACHE_EXPIRY_DAYS
+from poke_merkdo.config import CACHE_DIR, CACHE_EXPIRY_DAYS, NOT_FOUND_EXPIRY_DAYS
+
+logger = getLogger(__name__)
+
+MAX_DOWNLOAD_WORKERS = 32
+IMAGE_BYTES_KEY = "__image_bytes__"
+MISSING_IMAGE = "__MISSING__"
+DOWNLOAD_TIMEOUT = (3, 10)
+# Catalog cells are 1.5" x 2.1", so this is ~200 dpi on the page
+THUMBNAIL_SIZE = (300, 420)
 
 
 class ImageCache:
@@ -18,6 +34,18 @@ class ImageCache:
         self.cache_dir = cache_dir
         self.cache = Cache(str(cache_dir))
         self.expiry_seconds = CACHE_EXPIRY_DAYS * 24 * 60 * 60
+        self.missing_expiry_seconds = NOT_FOUND_EXPIRY_DAYS * 24 * 60 * 60
+
+        self._session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def get_image(self, url: str, card_id: str) -> Path | None:
         """
@@ -30,7 +58,9 @@ class ImageCache:
         cache_key = f"img_{card_id}"
 
         cached_path = self.cache.get(cache_key)
-        if cached_path and Path(cached_path).exists():
+        if cached_path == (MISSING_IMAGE, url):
+            return None
+        if isinstance(cached_path, str) and Path(cached_path).exists():
             return Path(cached_path)
 
         try:
@@ -39,37 +69,135 @@ class ImageCache:
                 self.cache.set(cache_key, str(image_path), expire=self.expiry_seconds)
                 return image_path
         except Exception as e:
-            print(f"Error downloading image for {card_id}: {e}")
+            logger.warning(f"Error downloading image for {card_id}: {e}")
             return None
 
         return None
 
+    def get_images_bulk(self, items: list[tuple[str, str]]) -> list[Path | None]:
+        """
+        Get many images at once, downloading missing ones in parallel.
+        Takes (url, card_id) pairs and returns paths in the same order.
+        """
+        unique = {card_id: url for url, card_id in reversed(items)}
+        if not unique:
+            return []
+
+        workers = min(MAX_DOWNLOAD_WORKERS, len(unique))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            paths = dict(
+                zip(
+                    unique,
+                    executor.map(
+                        lambda card_id: self.get_image(unique[card_id], card_id),
+                        unique,
+                    ),
+                )
+            )
+
+        return [paths[card_id] for _, card_id in items]
+
+    def get_thumbnail(
+        self, image_path: Path, size: tuple[int, int] = THUMBNAIL_SIZE
+    ) -> Path:
+        """
+        Get a copy of a cached image scaled down to fit size.
+        The copy is kept next to the original and rebuilt when the original
+        is newer; images already within size are returned as they are.
+        """
+        thumb_path = image_path.with_name(f"{image_path.stem}_{size[0]}x{size[1]}.jpg")
+        try:
+            if thumb_path.stat().st_mtime_ns >= image_path.stat().st_mtime_ns:
+                return thumb_path
+        except FileNotFoundError:
+            pass
+
+        try:
+            with pil_open(image_path) as img:
+                if img.width <= size[0] and img.height <= size[1]:
+                    return image_path
+                img.draft("RGB", size)
+                thumb = img.convert("RGB")
+                thumb.thumbnail(size, Resampling.LANCZOS)
+                partial_path = thumb_path.with_suffix(".part")
+                thumb.save(partial_path, "JPEG", quality=85, optimize=True)
+
+            old_size = thumb_path.stat().st_size if thumb_path.exists() else 0
+            partial_path.replace(thumb_path)
+            self._track_image_bytes(thumb_path.stat().st_size - old_size)
+            return thumb_path
+
+        except Exception as e:
+            logger.warning(f"Failed to create thumbnail for {image_path.name}: {e}")
+            return image_path
+
     def _download_image(self, url: str, card_id: str) -> Path | None:
-        """Download image from URL and save to cache"""
+        """
+        Download image from URL and save to cache as JPEG.
+        JPEG sources are streamed to disk as-is; others are re-encoded.
+        A 404 is remembered for a day so the URL isn't retried every run;
+        the marker records the URL, so a corrected URL is tried right away.
+        """
         try:
-            response = requests_get(url, timeout=30)
+            response = self._session.get(url, timeout=DOWNLOAD_TIMEOUT, stream=True)
+            if response.status_code == 404:
+                response.close()
+                self.cache.set(
+                    f"img_{card_id}",
+                    (MISSING_IMAGE, url),
+                    expire=self.missing_expiry_seconds,
+                )
+                logger.warning(f"Image not found for {card_id}: {url}")
+                return None
             response.raise_for_status()
+            response.raw.decode_content = True
 
             image_path = self.cache_dir / f"{card_id}.jpg"
-
-            img: PILImage = pil_open(BytesIO(response.content))
-            img = img.convert("RGB")
-            img.save(image_path, "JPEG", quality=95)
-
+            partial_path = image_path.with_suffix(".part")
+
+            content_type = response.headers.get("Content-Type", "")
+            if content_type.startswith("image/jpeg") or url.lower().endswith(
+                (".jpg", ".jpeg")
+            ):
+                with open(partial_path, "wb") as f:
+                    copyfileobj(response.raw, f)
+            else:
+                img: PILImage = pil_open(BytesIO(response.raw.read()))
+                img = img.convert("RGB")
+                img.save(partial_path, "JPEG", quality=85, optimize=True)
+
+            old_size = image_path.stat().st_size if image_path.exists() else 0
+            partial_path.replace(image_path)
+            self._track_image_bytes(image_path.stat().st_size - old_size)
             return image_path
 
         except Exception as e:
-            print(f"Failed to download image: {e}")
+            logger.warning(f"Failed to download image: {e}")
             return None
 
     def clear_cache(self) -> None:
         """Clear all cached images"""
         self.cache.clear()
 
-    def get_cache_size(self) -> int:
-        """Get cache size in bytes"""
-        total_size = 0
-        for item in self.cache_dir.iterdir():
-            if item.is_file():
-                total_size += item.stat().st_size
-        return total_size
+    def get_cache_size(self, recompute: bool = False) -> int:
+        """
+        Get cache size in bytes.
+        Uses the running image total kept by downloads; recompute=True (or a
+        missing total, e.g. after clear_cache) rescans the directory.
+        """
+        image_bytes = None if recompute else self.cache.get(IMAGE_BYTES_KEY)
+        if image_bytes is None:
+            image_bytes = sum(
+                entry.stat().st_size
+                for entry in scandir(self.cache_dir)
+                if entry.is_file() and not entry.name.startswith("cache.db")
+            )
+            self.cache.set(IMAGE_BYTES_KEY, image_bytes)
+        return int(self.cache.volume()) + int(image_bytes or 0)
+
+    def _track_image_bytes(self, delta: int) -> None:
+        """Update the running image total, if one is being tracked"""
+        try:
+            self.cache.incr(IMAGE_BYTES_KEY, delta, default=None)
+        except KeyError:
+            pass
@@ -1,32 +1,46 @@
 """Main CLI application"""
 
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from datetime import datetime
 from decimal import Decimal
-from json import dump as json_dump
-from json import load as json_load
+from hashlib import blake2b
+from itertools import pairwise
+from json import dumps as json_dumps
+from json import loads as json_loads
 from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, UnpicklingError
+from pickle import dump as pickle_dump
+from pickle import load as pickle_load
+from re import compile as re_compile
+from shutil import rmtree
+from sys import stdout
+from typing import TYPE_CHECKING, Any, Final
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
 from rich.table import Table
 
-from poke_merkdo.api.tcgdex_enricher import enrich_cards_sync
-from poke_merkdo.cache import ImageCache
+from poke_merkdo import __version__
 from poke_merkdo.config import (
     CATALOG_DIR,
     CATALOG_TITLE,
+    COLLECTION_CACHE_DIR,
     COLLECTION_CSV,
     CONFIG_JSON,
     LOGS_DIR,
     PRICES_JSON,
+    ensure_dir,
     get_config,
     update_config,
 )
-from poke_merkdo.generators import PDFGenerator
-from poke_merkdo.models import Card, Collection, SaleableCard
-from poke_merkdo.parsers import CSVParser
+
+if TYPE_CHECKING:
+    from poke_merkdo.models import Card, Collection, SaleableCard
 
 app = typer.Typer(
     name="poke-merkdo",
@@ -36,6 +50,11 @@ app = typer.Typer(
 )
 console = Console(legacy_windows=True, force_terminal=True)
 
+_NON_DIGITS = re_compile(r"\D+")
+
+# Bump when Card/Collection or the parser change what a pickled collection holds
+COLLECTION_CACHE_FORMAT: Final[int] = 3
+
 
 @app.command()
 def generate(  # noqa: PLR0913
@@ -53,6 +72,12 @@ def generate(  # noqa: PLR0913
         help="Path to collection CSV file",
         show_default=True,
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Re-parse the CSV instead of reusing the cached collection",
+        show_default=True,
+    ),
     enrich: bool = typer.Option(
         False,
         "--enrich/--no-enrich",
@@ -107,6 +132,10 @@ def generate(  # noqa: PLR0913
     Cards are sorted by set and number by default.
     """
     console.print(Panel.fit("Poke MerKdo - Catalog Generator", style="bold magenta"))
+    run_time = datetime.now()
+    run_date = f"{run_time.year:04d}-{run_time.month:02d}-{run_time.day:02d}"
+    hour, minute, second = run_time.hour, run_time.minute, run_time.second
+    timestamp = f"{run_date}_{hour:02d}{minute:02d}{second:02d}"
 
     if not csv_file.exists():
         console.print(f"[red]X[/red] CSV file not found: {csv_file}")
@@ -122,27 +151,21 @@ def generate(  # noqa: PLR0913
             "Finalizing",
         ]
 
-    total_steps = len(steps)
+    next_steps = iter(steps[1:])
+
+    with _progress_or_null() as progress:
+        main_task = progress.add_task(f"[cyan]{steps[0]}...", total=len(steps))
+
+        def step_done() -> None:
+            progress.update(
+                main_task,
+                description=f"[cyan]{next(next_steps)}...",
+                advance=1,
+            )
+
+        collection = _load_collection_cached(csv_file, use_cache=not no_cache)
+        step_done()
 
-    with Progress(
-        TextColumn("[bold blue]{task.description}"),
-        BarColumn(bar_width=40),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TimeElapsedColumn(),
-        console=console,
-        transient=False,
-    ) as progress:
-        main_task = progress.add_task("Overall progress", total=total_steps)
-        current_step = 0
-
-        progress.update(main_task, description=f"[cyan]{steps[current_step]}...")
-        parser = CSVParser(csv_file)
-        collection = parser.parse()
-        _load_custom_prices(collection)
-        current_step += 1
-        progress.update(main_task, completed=current_step)
-
-        progress.update(main_task, description=f"[cyan]{steps[current_step]}...")
         if all_cards:
             min_quantity = 1
         saleable = collection.get_cards_by_min_quantity(min_quantity)
@@ -153,26 +176,25 @@ def generate(  # noqa: PLR0913
             progress.stop()
             console.print(f"[red]No cards with quantity >= {min_quantity} found.[/red]")
             raise typer.Exit(0)
-        current_step += 1
-        progress.update(main_task, completed=current_step)
+        step_done()
 
         not_found_cards: list[Card] = []
         if enrich:
-            progress.update(main_task, description=f"[cyan]{steps[current_step]}...")
+            from poke_merkdo.api.tcgdex_enricher import enrich_cards_sync
+
             cards_to_enrich = [sc.card for sc in saleable]
             found, not_found, not_found_cards = enrich_cards_sync(
                 cards=cards_to_enrich,
                 language="en",
                 show_progress=False,
-                max_concurrent=20,
             )
-            current_step += 1
-            progress.update(main_task, completed=current_step)
+            step_done()
 
-        progress.update(main_task, description=f"[cyan]{steps[current_step]}...")
         if not output:
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
-            output = CATALOG_DIR / f"catalog_{timestamp}.pdf"
+            output = ensure_dir(CATALOG_DIR) / f"catalog_{timestamp}.pdf"
+
+        from poke_merkdo.cache import ImageCache
+        from poke_merkdo.generators import PDFGenerator
 
         cache = ImageCache()
         generator = PDFGenerator(cache)
@@ -188,14 +210,9 @@ def generate(  # noqa: PLR0913
                 saleable_cards=saleable,
                 show_progress=False,
             )
-            current_step += 1
-            progress.update(main_task, completed=current_step)
+            step_done()
 
-            progress.update(main_task, description=f"[cyan]{steps[current_step]}...")
-            current_step += 1
-            progress.update(
-                main_task, completed=current_step, description="[green]Complete!"
-            )
+            progress.update(main_task, description="[green]Complete!", advance=1)
 
         except Exception as e:
             progress.stop()
@@ -223,19 +240,17 @@ def generate(  # noqa: PLR0913
             f"[green]OK[/green] Enriched: {found} found, {not_found} not found"
         )
         if not_found_cards:
-            log_file = (
-                LOGS_DIR / f"not_found_{datetime.now().strftime('%Y-%m-%d_%H%M%S')}.txt"
+            log_file = ensure_dir(LOGS_DIR) / f"not_found_{timestamp}.txt"
+            header = (
+                f"Cards not found - {run_date} {hour:02d}:{minute:02d}:{second:02d}\n"
+                f"Total: {not_found}\n"
+                f"{'-' * 50}\n\n"
             )
-            with open(log_file, "w", encoding="utf-8") as f:
-                f.write(
-                    f"Cards not found - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-                )
-                f.write(f"Total: {not_found}\n")
-                f.write("-" * 50 + "\n\n")
-                for card in not_found_cards:
-                    f.write(
-                        f"{card.card_name} | {card.console_name} | #{card.card_number}\n"
-                    )
+            body = "".join(
+                f"{card.card_name} | {card.console_name} | #{card.card_number}\n"
+                for card in not_found_cards
+            )
+            log_file.write_text(header + body, encoding="utf-8")
             console.print("[yellow]  Not found (first 10):[/yellow]")
             for card in not_found_cards[:10]:
                 console.print(f"    - {card.card_name} ({card.console_name})")
@@ -246,8 +261,8 @@ def generate(  # noqa: PLR0913
 
     console.print(f"\n[bold green]Success![/bold green] Catalog: {output_path}")
 
-    total_value = sum((card.price_dollars for card in collection.cards), Decimal(0))
-    console.print(f"[bold]Total collection value:[/bold] ${total_value:.2f}")
+    total_value = _format_cents(collection.total_card_cents())
+    console.print(f"[bold]Total collection value:[/bold] {total_value}")
 
 
 @app.command()
@@ -259,6 +274,12 @@ def list_cards(
         help="Path to collection CSV file",
         show_default=True,
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Re-parse the CSV instead of reusing the cached collection",
+        show_default=True,
+    ),
     saleable_only: bool = typer.Option(
         False,
         "--saleable",
@@ -274,20 +295,17 @@ def list_cards(
     ),
 ) -> None:
     """List all cards in collection."""
-    parser = CSVParser(csv_file)
-    collection = parser.parse()
-
-    _load_custom_prices(collection)
+    collection = _load_collection_cached(csv_file, set_filter, use_cache=not no_cache)
 
+    cards: Sequence[Card]
     if saleable_only:
-        cards = [sc.card for sc in collection.get_saleable_cards()]
+        cards = [c for c in collection.cards if c.is_saleable]
         title = f"Saleable Cards ({len(cards)})"
     else:
-        cards = list(collection.cards)
+        cards = collection.cards
         title = f"All Cards ({len(cards)})"
 
     if set_filter:
-        cards = [c for c in cards if set_filter.lower() in c.console_name.lower()]
         title += f" - Set: {set_filter}"
 
     table = Table(title=title, show_header=True, header_style="bold magenta")
@@ -297,17 +315,9 @@ def list_cards(
     table.add_column("Price", justify="right", style="green")
     table.add_column("Total", justify="right", style="bold green")
 
-    for card in cards:
-        qty_for_sale = max(0, card.quantity - 1) if card.quantity >= 2 else 0
-        total = card.price_dollars * qty_for_sale if qty_for_sale > 0 else Decimal(0)
-
-        table.add_row(
-            card.card_name,
-            card.console_name[:30],
-            str(qty_for_sale) if qty_for_sale > 0 else "-",
-            f"${card.price_dollars:.2f}",
-            f"${total:.2f}" if total > 0 else "-",
-        )
+    rows = [_card_row(card) for card in cards]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -323,14 +333,18 @@ def set_price(
         help="Path to collection CSV file",
         show_default=True,
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Re-parse the CSV instead of reusing the cached collection",
+        show_default=True,
+    ),
 ) -> None:
     """Set custom price for a card."""
-    parser = CSVParser(csv_file)
-    collection = parser.parse()
+    collection = _load_collection_cached(csv_file, use_cache=not no_cache)
 
-    matches = [
-        c for c in collection.cards if card_name.lower() in c.product_name.lower()
-    ]
+    needle = card_name.lower()
+    matches = [c for c in collection.cards if needle in c.product_name_lc]
 
     if not matches:
         console.print(f"[red]X[/red] No cards found matching: {card_name}")
@@ -350,16 +364,17 @@ def set_price(
     else:
         selected_card = matches[0]
 
-    prices = {}
-    if PRICES_JSON.exists():
-        with open(PRICES_JSON) as f:
-            prices = json_load(f)
+    try:
+        prices = json_loads(PRICES_JSON.read_bytes())
+    except FileNotFoundError:
+        prices = {}
 
     prices[selected_card.id] = float(price)
 
-    PRICES_JSON.parent.mkdir(parents=True, exist_ok=True)
-    with open(PRICES_JSON, "w") as f:
-        json_dump(prices, f, indent=2)
+    ensure_dir(PRICES_JSON.parent)
+    tmp_file = PRICES_JSON.with_suffix(".json.tmp")
+    tmp_file.write_bytes(_json_bytes(prices))
+    tmp_file.replace(PRICES_JSON)
 
     console.print(
         f"[green]OK[/green] Updated price for "
@@ -376,14 +391,15 @@ def stats(
         help="Path to collection CSV file",
         show_default=True,
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Re-parse the CSV instead of reusing the cached collection",
+        show_default=True,
+    ),
 ) -> None:
     """Show collection statistics."""
-    parser = CSVParser(csv_file)
-    collection = parser.parse()
-
-    _load_custom_prices(collection)
-
-    saleable = collection.get_saleable_cards()
+    collection = _load_collection_cached(csv_file, use_cache=not no_cache)
 
     table = Table(title="Collection Statistics", show_header=False)
     table.add_column("Metric", style="cyan")
@@ -391,7 +407,9 @@ def stats(
 
     table.add_row("Total unique cards", str(collection.total_unique_cards()))
     table.add_row("Total cards (with duplicates)", str(collection.total_cards()))
-    table.add_row("Saleable cards (unique)", str(len(saleable)))
+    table.add_row(
+        "Saleable cards (unique)", str(collection.total_saleable_unique_cards())
+    )
     table.add_row(
         "Saleable cards (total copies)", str(collection.total_saleable_cards())
     )
@@ -399,20 +417,22 @@ def stats(
 
     console.print(table)
 
-    sets = collection.get_unique_sets()
-    console.print(f"\n[cyan]Sets in collection:[/cyan] {len(sets)}")
-    for set_name in sets:
-        set_cards = collection.get_cards_by_set(set_name)
-        console.print(f"  • {set_name}: {len(set_cards)} cards")
+    cards_by_set = collection.cards_by_set
+    console.print(f"\n[cyan]Sets in collection:[/cyan] {len(cards_by_set)}")
+    for set_name in sorted(cards_by_set):
+        console.print(f"  • {set_name}: {len(cards_by_set[set_name])} cards")
 
 
 @app.command()
 def clear_cache() -> None:
-    """Clear image cache from data/cache/."""
+    """Clear image cache from data/cache/ and the parsed-collection cache."""
+    from poke_merkdo.cache import ImageCache
+
     cache = ImageCache()
     size_before = cache.get_cache_size()
 
     cache.clear_cache()
+    rmtree(COLLECTION_CACHE_DIR, ignore_errors=True)
     console.print(
         f"[green]OK[/green] Cache cleared ({size_before / 1024 / 1024:.2f} MB freed)"
     )
@@ -451,14 +471,9 @@ def config(
         table.add_column("Key", style="yellow")
         table.add_column("Value", style="green")
 
-        for k, v in current_config.items():
-            if k == "social_networks":
-                table.add_row(k, f"[{len(v)} networks]")
-            else:
-                display_value = str(v)
-                if len(display_value) > 50:
-                    display_value = display_value[:47] + "..."
-                table.add_row(k, display_value)
+        rows = [(k, _config_display_value(k, v)) for k, v in current_config.items()]
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
 
@@ -515,6 +530,40 @@ def config(
         console.print(f"  [green]New:[/green] {value}")
 
 
+class _NullProgress:
+    """Stand-in for rich Progress that ignores every update"""
+
+    def add_task(self, *args: Any, **kwargs: Any) -> int:
+        return 0
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+def _progress_or_null() -> AbstractContextManager[Any]:
+    """Progress bar for interactive runs, a no-op one when output is piped.
+
+    The console forces terminal mode, so stdout itself is checked.
+    """
+    if not stdout.isatty():
+        return nullcontext(_NullProgress())
+
+    from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
+
+    return Progress(
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(bar_width=40),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TimeElapsedColumn(),
+        console=console,
+        transient=False,
+        refresh_per_second=4,
+    )
+
+
 def _sort_cards(cards: list[SaleableCard], sort_by: str) -> list[SaleableCard]:
     """Sort cards by specified criteria.
 
@@ -523,40 +572,185 @@ def _sort_cards(cards: list[SaleableCard], sort_by: str) -> list[SaleableCard]:
         sort_by: Sort method - 'set' (collection + number), 'name', 'price'
 
     Returns:
-        Sorted list of cards
+        Sorted list of cards (the input list itself if already in order)
     """
+    if len(cards) <= 1:
+        return cards
+
     if sort_by == "name":
-        return sorted(cards, key=lambda sc: sc.card.card_name.lower())
+        return sorted(cards, key=lambda sc: sc.card.card_name_lc)
 
     if sort_by == "price":
         return sorted(cards, key=lambda sc: sc.card.price_dollars, reverse=True)
 
     def set_sort_key(sc: SaleableCard) -> tuple[str, int]:
         card = sc.card
-        num = 0
-        if card.card_number:
-            digits = "".join(c for c in card.card_number if c.isdigit())
-            num = int(digits) if digits else 0
-        return (card.console_name.lower(), num)
+        digits = _NON_DIGITS.sub("", card.card_number)
+        return (card.console_name_lc, int(digits) if digits else 0)
+
+    keys = [set_sort_key(sc) for sc in cards]
+    if all(a <= b for a, b in pairwise(keys)):
+        return cards
+    order = sorted(range(len(cards)), key=keys.__getitem__)
+    return [cards[i] for i in order]
+
+
+def _load_collection_cached(
+    csv_file: Path, set_filter: str | None = None, use_cache: bool = True
+) -> Collection:
+    """Load the collection with custom prices, reusing a pickled copy.
+
+    The pickle is keyed by the cache format, package version, CSV path, size
+    and mtime and the prices file mtime, so any change to either file or to
+    the code that builds the collection triggers a fresh parse.
+    With set_filter, only cards whose set name contains it are returned;
+    on a cache miss the filter is applied while parsing and nothing is cached.
+    use_cache=False (--no-cache) always parses and leaves the pickle alone.
+    """
+    stat = csv_file.stat()
+    try:
+        prices_mtime = PRICES_JSON.stat().st_mtime_ns
+    except FileNotFoundError:
+        prices_mtime = 0
+    resolved = str(csv_file.resolve())
+    key = (
+        COLLECTION_CACHE_FORMAT,
+        __version__,
+        resolved,
+        stat.st_mtime_ns,
+        stat.st_size,
+        prices_mtime,
+    )
+    digest = blake2b(resolved.encode(), digest_size=8).hexdigest()
+    cache_file = COLLECTION_CACHE_DIR / f"collection_{digest}.pkl"
 
-    return sorted(cards, key=set_sort_key)
+    cached = _read_collection_pickle(cache_file, key) if use_cache else None
+    if cached is not None:
+        if set_filter:
+            from poke_merkdo.models import Collection
 
+            return Collection.model_construct(
+                cards=tuple(cached.get_cards_by_set_contains(set_filter))
+            )
+        return cached
+
+    from poke_merkdo.parsers import CSVParser
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        prices_future = executor.submit(_read_custom_prices)
+        collection = CSVParser(csv_file).parse(set_filter=set_filter)
+        _apply_custom_prices(collection, prices_future.result())
+    if set_filter or not use_cache:
+        return collection
+
+    try:
+        ensure_dir(COLLECTION_CACHE_DIR)
+        tmp_file = cache_file.with_suffix(".pkl.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle_dump((key, collection), f, protocol=HIGHEST_PROTOCOL)
+        tmp_file.replace(cache_file)
+    except OSError:
+        pass
+
+    return collection
 
-def _load_custom_prices(collection: Collection) -> None:
-    """Load custom prices from JSON file"""
-    if not PRICES_JSON.exists():
-        return
+
+def _read_collection_pickle(cache_file: Path, key: tuple) -> Collection | None:
+    """Collection pickled under key, or None if the cache is missing or stale"""
+    from poke_merkdo.models import Collection
 
     try:
-        with open(PRICES_JSON) as f:
-            prices = json_load(f)
+        with open(cache_file, "rb") as f:
+            cached = pickle_load(f)
+    except FileNotFoundError:
+        return None
+    except (
+        OSError,
+        UnpicklingError,
+        EOFError,
+        AttributeError,
+        ImportError,
+        ValueError,
+    ) as e:
+        console.print(
+            f"[yellow]Warning: Ignoring unreadable collection cache: {e}[/yellow]"
+        )
+        return None
+
+    if not isinstance(cached, tuple) or len(cached) != 2 or cached[0] != key:
+        return None
+    collection = cached[1]
+    if not isinstance(collection, Collection):
+        console.print(
+            "[yellow]Warning: Ignoring collection cache with unexpected contents"
+            "[/yellow]"
+        )
+        return None
+    return collection
+
+
+def _card_row(card: Card) -> tuple[str, str, str, str, str]:
+    """Formatted list-cards row: name, set, qty for sale, price, total"""
+    quantity = card.quantity
+    qty_for_sale = quantity - 1 if quantity >= 2 else 0
+    price_cents = card.price_cents
+    total_cents = price_cents * qty_for_sale if qty_for_sale else 0
+    return (
+        card.card_name,
+        card.console_name[:30],
+        str(qty_for_sale) if qty_for_sale else "-",
+        _format_cents(price_cents),
+        _format_cents(total_cents) if total_cents > 0 else "-",
+    )
+
+
+def _config_display_value(key: str, value: Any) -> str:
+    """Short display form of a config value for the config table"""
+    if key == "social_networks":
+        return f"[{len(value)} networks]"
+    display_value = str(value)
+    if len(display_value) > 50:
+        display_value = display_value[:47] + "..."
+    return display_value
 
-        for card in collection.cards:
-            if card.id in prices:
-                card.custom_price = Decimal(str(prices[card.id]))
 
+def _format_cents(cents: int | Decimal) -> str:
+    """Format a cent amount as dollars, e.g. 1070 -> '$10.70'
+
+    Fractional Decimal cents are rounded half-even here, once, like '.2f'.
+    """
+    cents = round(cents)
+    sign = "-" if cents < 0 else ""
+    dollars, rest = divmod(abs(cents), 100)
+    return f"{sign}${dollars}.{rest:02d}"
+
+
+def _json_bytes(data: dict) -> bytes:
+    """Serialize data as indented JSON with sorted keys"""
+    return json_dumps(data, indent=2, sort_keys=True).encode()
+
+
+def _read_custom_prices() -> dict[str, Decimal]:
+    """Read custom prices from JSON file as {card_id: price}"""
+    try:
+        prices = json_loads(PRICES_JSON.read_bytes())
+        return {card_id: Decimal(str(price)) for card_id, price in prices.items()}
+    except FileNotFoundError:
+        return {}
     except Exception as e:
         console.print(f"[yellow]Warning: Could not load custom prices: {e}[/yellow]")
+        return {}
+
+
+def _apply_custom_prices(collection: Collection, prices: dict[str, Decimal]) -> None:
+    """Set custom prices on the cards they belong to"""
+    if not prices:
+        return
+
+    for card in collection.cards:
+        custom_price = prices.get(card.id)
+        if custom_price is not None:
+            card.custom_price = custom_price
 
 
 if __name__ == "__main__":
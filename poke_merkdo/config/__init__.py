@@ -1,38 +1,45 @@
 """Configuration module for Poke MerKdo"""
 
-from poke_merkdo.config.constants import AUTHOR, CACHE_EXPIRY_DAYS
+from typing import Any
+
+from poke_merkdo.config.constants import (
+    AUTHOR,
+    CACHE_EXPIRY_DAYS,
+    NOT_FOUND_EXPIRY_DAYS,
+    SET_MAPPING_EXPIRY_DAYS,
+)
 from poke_merkdo.config.paths import (
     CACHE_DIR,
     CATALOG_DIR,
+    COLLECTION_CACHE_DIR,
     COLLECTION_CSV,
     CONFIG_JSON,
     DATA_DIR,
     LOGS_DIR,
     PRICES_JSON,
     PROJECT_ROOT,
+    TCGDEX_CACHE_DIR,
+    ensure_dir,
 )
-from poke_merkdo.config.store import (
-    CATALOG_TITLE,
-    CONTACT_MESSAGE,
-    LOGO_PATH,
-    SOCIAL_NETWORKS,
-    STORE_NAME,
-    WELCOME_MESSAGE,
-    get_config,
-    update_config,
-)
+from poke_merkdo.config import store as _store
+from poke_merkdo.config.store import get_config, update_config
 
 __all__ = [
     "PROJECT_ROOT",
     "DATA_DIR",
     "CACHE_DIR",
+    "TCGDEX_CACHE_DIR",
+    "COLLECTION_CACHE_DIR",
     "LOGS_DIR",
     "CATALOG_DIR",
     "COLLECTION_CSV",
     "PRICES_JSON",
     "CONFIG_JSON",
+    "ensure_dir",
     "AUTHOR",
     "CACHE_EXPIRY_DAYS",
+    "SET_MAPPING_EXPIRY_DAYS",
+    "NOT_FOUND_EXPIRY_DAYS",
     "STORE_NAME",
     "CATALOG_TITLE",
     "LOGO_PATH",
@@ -42,3 +49,10 @@ __all__ = [
     "get_config",
     "update_config",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Store settings are read from config.json only when first accessed"""
+    if name in _store.SETTING_KEYS:
+        return getattr(_store, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
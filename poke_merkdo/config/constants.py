@@ -5,3 +5,5 @@ from typing import Final
 AUTHOR: Final[str] = "Wembie"
 
 CACHE_EXPIRY_DAYS: Final[int] = 30
+SET_MAPPING_EXPIRY_DAYS: Final[int] = 7
+NOT_FOUND_EXPIRY_DAYS: Final[int] = 1
@@ -7,6 +7,8 @@ PROJECT_ROOT: Final[Path] = Path(__file__).parent.parent.parent
 DATA_DIR: Final[Path] = PROJECT_ROOT / "data"
 
 CACHE_DIR: Final[Path] = DATA_DIR / "cache"
+TCGDEX_CACHE_DIR: Final[Path] = CACHE_DIR / "tcgdex"
+COLLECTION_CACHE_DIR: Final[Path] = DATA_DIR / "collection_cache"
 LOGS_DIR: Final[Path] = DATA_DIR / "logs"
 CATALOG_DIR: Final[Path] = PROJECT_ROOT / "catalogs"
 
@@ -14,6 +16,8 @@ COLLECTION_CSV: Final[Path] = PROJECT_ROOT / "collection.csv"
 PRICES_JSON: Final[Path] = DATA_DIR / "prices.json"
 CONFIG_JSON: Final[Path] = DATA_DIR / "config.json"
 
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
-CATALOG_DIR.mkdir(parents=True, exist_ok=True)
+
+def ensure_dir(path: Path) -> Path:
+    """Create a directory (and parents) if missing; returns the path"""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -1,11 +1,11 @@
 """Store configuration management for Poke MerKdo"""
 
-from json import dump as json_dump
-from json import load as json_load
-from pathlib import Path
-from typing import Final
+from json import JSONDecodeError
+from json import dumps as json_dumps
+from json import loads as json_loads
+from typing import Any, Final
 
-from poke_merkdo.config.paths import CONFIG_JSON, PROJECT_ROOT
+from poke_merkdo.config.paths import CONFIG_JSON, PROJECT_ROOT, ensure_dir
 
 STORE_NAME_DEFAULT: Final[str] = "Poke MerKdo"
 
@@ -30,55 +30,96 @@ DEFAULT_CONFIG: Final[dict] = {
 }
 
 
+# Settings exposed as module attributes, read lazily from the config file
+SETTING_KEYS: Final[dict[str, str]] = {
+    "STORE_NAME": "store_name",
+    "CATALOG_TITLE": "catalog_title",
+    "LOGO_PATH": "logo_path",
+    "SOCIAL_NETWORKS": "social_networks",
+    "WELCOME_MESSAGE": "welcome_message",
+    "CONTACT_MESSAGE": "contact_message",
+}
+
+_config_cache: dict | None = None
+_config_mtime: int | None = None
+
+
+def _config_file_mtime() -> int | None:
+    """mtime of the config file in ns, or None if it doesn't exist"""
+    try:
+        return CONFIG_JSON.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 def _load_config() -> dict:
     """Load configuration from JSON file or use defaults
 
     - If config.json doesn't exist, creates empty one and uses defaults
     - If config.json is empty or {}, uses defaults
     - If config.json has values, merges with defaults (user values take priority)
+
+    The result is cached until the file's mtime changes.
     """
-    if not CONFIG_JSON.exists():
-        CONFIG_JSON.parent.mkdir(parents=True, exist_ok=True)
-        with open(CONFIG_JSON, "w", encoding="utf-8") as f:
-            f.write("{}\n")
+    global _config_cache, _config_mtime
+
+    mtime = _config_file_mtime()
+    if _config_cache is not None and mtime is not None and mtime == _config_mtime:
+        return _config_cache
+
+    _config_cache = _read_config()
+    _config_mtime = _config_file_mtime()
+    return _config_cache
+
+
+def _read_config() -> dict:
+    """Read configuration from disk, merged with defaults"""
+    try:
+        raw = CONFIG_JSON.read_bytes()
+    except FileNotFoundError:
+        ensure_dir(CONFIG_JSON.parent)
+        CONFIG_JSON.write_bytes(b"{}\n")
         return DEFAULT_CONFIG.copy()
 
     try:
-        with open(CONFIG_JSON, encoding="utf-8") as f:
-            user_config = json_load(f)
-        if not user_config:
-            return DEFAULT_CONFIG.copy()
-        return {**DEFAULT_CONFIG, **user_config}
-    except Exception:
+        user_config = json_loads(raw)
+    except (JSONDecodeError, UnicodeDecodeError):
+        return DEFAULT_CONFIG.copy()
+    if not isinstance(user_config, dict) or not user_config:
         return DEFAULT_CONFIG.copy()
+    return {**DEFAULT_CONFIG, **user_config}
 
 
 def _save_config(config: dict) -> None:
     """Save configuration to JSON file"""
-    CONFIG_JSON.parent.mkdir(parents=True, exist_ok=True)
-    with open(CONFIG_JSON, "w", encoding="utf-8") as f:
-        json_dump(config, f, indent=2, ensure_ascii=False)
+    ensure_dir(CONFIG_JSON.parent)
+    data = json_dumps(config, indent=2, ensure_ascii=False).encode("utf-8")
+    CONFIG_JSON.write_bytes(data)
 
 
 def get_config() -> dict:
-    """Get current configuration"""
-    return _load_config()
+    """Get current configuration (a copy; use update_config to change it)"""
+    return dict(_load_config())
 
 
 def update_config(key: str, value: str) -> None:
     """Update a configuration value"""
-    config = _load_config()
+    global _config_cache, _config_mtime
+
+    config = dict(_load_config())
     config[key] = value
     _save_config(config)
+    _config_cache = config
+    _config_mtime = _config_file_mtime()
 
 
-_config = _load_config()
+def __getattr__(name: str) -> Any:
+    """Resolve STORE_NAME, CATALOG_TITLE, etc. from the config on first use"""
+    if name not in SETTING_KEYS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-STORE_NAME: str = _config.get("store_name", DEFAULT_CONFIG["store_name"])
-CATALOG_TITLE: str = _config.get("catalog_title", DEFAULT_CONFIG["catalog_title"])
-LOGO_PATH: Path = PROJECT_ROOT / _config.get("logo_path", DEFAULT_CONFIG["logo_path"])
-SOCIAL_NETWORKS: list[dict] = _config.get(
-    "social_networks", DEFAULT_CONFIG["social_networks"]
-)
-WELCOME_MESSAGE: str = _config.get("welcome_message", DEFAULT_CONFIG["welcome_message"])
-CONTACT_MESSAGE: str = _config.get("contact_message", DEFAULT_CONFIG["contact_message"])
+    key = SETTING_KEYS[name]
+    value = _load_config().get(key, DEFAULT_CONFIG[key])
+    if name == "LOGO_PATH":
+        return PROJECT_ROOT / value
+    return value
@@ -8,6 +8,7 @@ from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.platypus import (
+    Flowable,
     PageBreak,
     Paragraph,
     SimpleDocTemplate,
@@ -27,52 +28,190 @@ from poke_merkdo.config import (
     SOCIAL_NETWORKS,
     WELCOME_MESSAGE,
 )
-from poke_merkdo.models import Collection, SaleableCard
+from poke_merkdo.models import Card, Collection, SaleableCard
 
 console = Console()
 
+# Styles are built once per process and shared by every catalog
+_SAMPLE_STYLES = getSampleStyleSheet()
+_NORMAL = _SAMPLE_STYLES["Normal"]
+_RED = colors.HexColor("#D32F2F")
+
+# Card cells stack their flowables directly in the grid; spaceBefore sets
+# the gap between them (ignored for the first one in a cell)
+CARD_NAME_STYLE = ParagraphStyle(
+    name="CardName",
+    parent=_NORMAL,
+    fontSize=9,
+    fontName="Helvetica-Bold",
+    alignment=1,
+    spaceBefore=4,
+)
+CARD_PRICE_STYLE = ParagraphStyle(
+    name="CardPrice",
+    parent=_NORMAL,
+    fontSize=10,
+    fontName="Helvetica-Bold",
+    textColor=colors.HexColor("#2E7D32"),
+    alignment=1,
+    spaceBefore=4,
+)
+CARD_INFO_STYLE = ParagraphStyle(
+    name="CardInfo",
+    parent=_NORMAL,
+    fontSize=7,
+    textColor=colors.grey,
+    alignment=1,
+    spaceBefore=4,
+)
+TITLE_STYLE = ParagraphStyle(
+    name="Title",
+    parent=_SAMPLE_STYLES["Heading1"],
+    fontSize=28,
+    textColor=_RED,
+    alignment=1,
+    spaceAfter=10,
+    fontName="Helvetica-Bold",
+)
+SUBTITLE_STYLE = ParagraphStyle(
+    name="Subtitle",
+    parent=_NORMAL,
+    fontSize=14,
+    textColor=colors.HexColor("#757575"),
+    alignment=1,
+    spaceAfter=30,
+    fontName="Helvetica-Oblique",
+)
+WELCOME_STYLE = ParagraphStyle(
+    name="Welcome",
+    parent=_NORMAL,
+    fontSize=11,
+    textColor=colors.HexColor("#424242"),
+    alignment=1,
+    spaceAfter=10,
+    leading=16,
+)
+CONTACT_STYLE = ParagraphStyle(
+    name="Contact",
+    parent=_NORMAL,
+    fontSize=10,
+    textColor=_RED,
+    alignment=1,
+    fontName="Helvetica-Bold",
+)
+SOCIAL_STYLE = ParagraphStyle(
+    name="Social",
+    parent=_NORMAL,
+    fontSize=12,
+    textColor=colors.HexColor("#E1306C"),
+    alignment=1,
+    fontName="Helvetica-Bold",
+    leading=18,
+)
+AUTHOR_STYLE = ParagraphStyle(
+    name="Author",
+    parent=_NORMAL,
+    fontSize=9,
+    textColor=colors.HexColor("#9E9E9E"),
+    alignment=1,
+    fontName="Helvetica-Oblique",
+)
+FOOTER_STYLE = ParagraphStyle(
+    name="Footer",
+    parent=_NORMAL,
+    fontSize=10,
+    textColor=_RED,
+    alignment=1,
+    leading=14,
+    fontName="Helvetica-Bold",
+)
+
+SUMMARY_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (0, -1), _RED),
+        ("TEXTCOLOR", (0, 0), (0, -1), colors.white),
+        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+        ("BACKGROUND", (1, 0), (1, -1), colors.HexColor("#FFEBEE")),
+        ("TEXTCOLOR", (1, 0), (1, -1), _RED),
+        ("FONTNAME", (1, 0), (1, -1), "Helvetica-Bold"),
+        ("ALIGN", (1, 0), (1, -1), "CENTER"),
+        ("FONTSIZE", (0, 0), (-1, -1), 12),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 14),
+        ("TOPPADDING", (0, 0), (-1, -1), 14),
+        ("BOX", (0, 0), (-1, -1), 2, _RED),
+        ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#FFCDD2")),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ]
+)
+CARD_PAGE_TABLE_STYLE = TableStyle(
+    [
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("LEFTPADDING", (0, 0), (-1, -1), 0.05 * inch),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 0.05 * inch),
+        ("TOPPADDING", (0, 0), (-1, -1), 7),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+        ("BOX", (0, 0), (-1, -1), 1, colors.lightgrey),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.lightgrey),
+    ]
+)
+TABLE_LAYOUT_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), _RED),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 11),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 14),
+        ("TOPPADDING", (0, 0), (-1, 0), 14),
+        ("BACKGROUND", (0, 1), (-1, -1), colors.white),
+        ("TEXTCOLOR", (0, 1), (-1, -1), colors.HexColor("#212121")),
+        ("ALIGN", (0, 1), (0, -1), "CENTER"),
+        ("ALIGN", (-1, 1), (-1, -1), "CENTER"),
+        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+        ("FONTSIZE", (0, 1), (-1, -1), 9),
+        ("TOPPADDING", (0, 1), (-1, -1), 10),
+        ("BOTTOMPADDING", (0, 1), (-1, -1), 10),
+        ("LEFTPADDING", (0, 1), (-1, -1), 8),
+        ("RIGHTPADDING", (0, 1), (-1, -1), 8),
+        (
+            "ROWBACKGROUNDS",
+            (0, 1),
+            (-1, -1),
+            [colors.white, colors.HexColor("#FFEBEE")],
+        ),
+        ("BACKGROUND", (-1, 1), (-1, -1), colors.HexColor("#FFF3E0")),
+        ("TEXTCOLOR", (-1, 1), (-1, -1), colors.HexColor("#E65100")),
+        ("FONTNAME", (-1, 1), (-1, -1), "Helvetica-Bold"),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#BDBDBD")),
+        ("BOX", (0, 0), (-1, -1), 2, _RED),
+        ("LINEBELOW", (0, 0), (-1, 0), 2, colors.HexColor("#B71C1C")),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ]
+)
+FOOTER_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#FFEBEE")),
+        ("BOX", (0, 0), (-1, -1), 1.5, _RED),
+        ("TOPPADDING", (0, 0), (-1, -1), 15),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 15),
+        ("LEFTPADDING", (0, 0), (-1, -1), 20),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 20),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+    ]
+)
+
 
 class PDFGenerator:
     """Generate professional PDF catalog of cards"""
 
     def __init__(self, cache: ImageCache | None = None):
         self.cache = cache or ImageCache()
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
         self._warnings: list[str] = []
-
-    def _setup_custom_styles(self) -> None:
-        """Setup custom paragraph styles"""
-        self.styles.add(
-            ParagraphStyle(
-                name="CardName",
-                parent=self.styles["Normal"],
-                fontSize=9,
-                fontName="Helvetica-Bold",
-                alignment=1,
-                spaceAfter=2,
-            )
-        )
-        self.styles.add(
-            ParagraphStyle(
-                name="CardPrice",
-                parent=self.styles["Normal"],
-                fontSize=10,
-                fontName="Helvetica-Bold",
-                textColor=colors.HexColor("#2E7D32"),
-                alignment=1,
-                spaceBefore=2,
-            )
-        )
-        self.styles.add(
-            ParagraphStyle(
-                name="CardInfo",
-                parent=self.styles["Normal"],
-                fontSize=7,
-                textColor=colors.grey,
-                alignment=1,
-            )
-        )
+        self._images: dict[str, RLImage] = {}
+        self._image_paths: dict[str, Path | None] = {}
+        self._paragraphs: dict[str, Paragraph] = {}
 
     def generate_catalog(
         self,
@@ -90,6 +229,9 @@ class PDFGenerator:
             Tuple of (output_path, list of warnings)
         """
         self._warnings = []
+        self._images = {}
+        self._image_paths = {}
+        self._paragraphs = {}
 
         if saleable_cards is None:
             saleable_cards = collection.get_saleable_cards()
@@ -107,6 +249,7 @@ class PDFGenerator:
             author=AUTHOR,
             title=title,
             creator=f"Poke MerKdo - {AUTHOR}",
+            pageCompression=1,
         )
 
         story = []
@@ -114,9 +257,18 @@ class PDFGenerator:
         story.extend(self._create_title_page(title, saleable_cards))
         story.append(PageBreak())
 
-        has_images = any(sc.card.image_url for sc in saleable_cards)
+        image_requests = [
+            (sc.card.image_url, sc.card.id)
+            for sc in saleable_cards
+            if sc.card.image_url
+        ]
+
+        if image_requests:
+            image_paths = self.cache.get_images_bulk(image_requests)
+            self._image_paths = {
+                card_id: path for (_, card_id), path in zip(image_requests, image_paths)
+            }
 
-        if has_images:
             cards_per_page = 9
             page_range = range(0, len(saleable_cards), cards_per_page)
             iterator = (
@@ -154,27 +306,8 @@ class PDFGenerator:
             except Exception as e:
                 self._warnings.append(f"Could not load logo: {e}")
 
-        title_style = ParagraphStyle(
-            name="Title",
-            parent=self.styles["Heading1"],
-            fontSize=28,
-            textColor=colors.HexColor("#D32F2F"),
-            alignment=1,
-            spaceAfter=10,
-            fontName="Helvetica-Bold",
-        )
-        elements.append(Paragraph(title, title_style))
-
-        subtitle_style = ParagraphStyle(
-            name="Subtitle",
-            parent=self.styles["Normal"],
-            fontSize=14,
-            textColor=colors.HexColor("#757575"),
-            alignment=1,
-            spaceAfter=30,
-            fontName="Helvetica-Oblique",
-        )
-        elements.append(Paragraph("Cartas Pokémon TCG Disponibles", subtitle_style))
+        elements.append(Paragraph(title, TITLE_STYLE))
+        elements.append(Paragraph("Cartas Pokémon TCG Disponibles", SUBTITLE_STYLE))
         elements.append(Spacer(1, 0.3 * inch))
 
         total_unique = len(saleable_cards)
@@ -187,69 +320,24 @@ class PDFGenerator:
         ]
 
         summary_table = Table(summary_data, colWidths=[3.5 * inch, 2 * inch])
-        summary_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#D32F2F")),
-                    ("TEXTCOLOR", (0, 0), (0, -1), colors.white),
-                    ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-                    ("BACKGROUND", (1, 0), (1, -1), colors.HexColor("#FFEBEE")),
-                    ("TEXTCOLOR", (1, 0), (1, -1), colors.HexColor("#D32F2F")),
-                    ("FONTNAME", (1, 0), (1, -1), "Helvetica-Bold"),
-                    ("ALIGN", (1, 0), (1, -1), "CENTER"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 12),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 14),
-                    ("TOPPADDING", (0, 0), (-1, -1), 14),
-                    ("BOX", (0, 0), (-1, -1), 2, colors.HexColor("#D32F2F")),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#FFCDD2")),
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ]
-            )
-        )
+        summary_table.setStyle(SUMMARY_TABLE_STYLE)
 
         elements.append(summary_table)
         elements.append(Spacer(1, 0.4 * inch))
 
-        welcome_style = ParagraphStyle(
-            name="Welcome",
-            parent=self.styles["Normal"],
-            fontSize=11,
-            textColor=colors.HexColor("#424242"),
-            alignment=1,
-            spaceAfter=10,
-            leading=16,
-        )
         welcome_text = (
             f"{WELCOME_MESSAGE}<br/>"
             "Todas las cartas están en excelente condición y listas para entrega.<br/>"
             f"<b>{CONTACT_MESSAGE}</b>"
         )
-        elements.append(Paragraph(welcome_text, welcome_style))
+        elements.append(Paragraph(welcome_text, WELCOME_STYLE))
         elements.append(Spacer(1, 0.2 * inch))
 
-        contact_style = ParagraphStyle(
-            name="Contact",
-            parent=self.styles["Normal"],
-            fontSize=10,
-            textColor=colors.HexColor("#D32F2F"),
-            alignment=1,
-            fontName="Helvetica-Bold",
-        )
         contact_text = "📱 Consulta precios por cualquier red social o mensaje directo"
-        elements.append(Paragraph(contact_text, contact_style))
+        elements.append(Paragraph(contact_text, CONTACT_STYLE))
 
         elements.append(Spacer(1, 0.3 * inch))
 
-        social_style = ParagraphStyle(
-            name="Social",
-            parent=self.styles["Normal"],
-            fontSize=12,
-            textColor=colors.HexColor("#E1306C"),
-            alignment=1,
-            fontName="Helvetica-Bold",
-            leading=18,
-        )
-
         platform_icons = {
             "instagram": "📸",
             "facebook": "📘",
@@ -268,20 +356,12 @@ class PDFGenerator:
 
             icon = platform_icons.get(platform.lower(), "🔗")
             social_text = f'{icon} {platform}: <a href="{url}">{handle}</a>'
-            elements.append(Paragraph(social_text, social_style))
+            elements.append(Paragraph(social_text, SOCIAL_STYLE))
 
         elements.append(Spacer(1, 0.4 * inch))
 
-        author_style = ParagraphStyle(
-            name="Author",
-            parent=self.styles["Normal"],
-            fontSize=9,
-            textColor=colors.HexColor("#9E9E9E"),
-            alignment=1,
-            fontName="Helvetica-Oblique",
-        )
         author_text = f"Creado por {AUTHOR}"
-        elements.append(Paragraph(author_text, author_style))
+        elements.append(Paragraph(author_text, AUTHOR_STYLE))
 
         return elements
 
@@ -293,7 +373,7 @@ class PDFGenerator:
 
         rows = []
         for i in range(0, 9, 3):
-            row = []
+            row: list[list[Flowable] | str] = []
             for j in range(3):
                 idx = i + j
                 if idx < len(saleable_cards):
@@ -307,57 +387,38 @@ class PDFGenerator:
 
         col_width = 1.8 * inch
         table = Table(rows, colWidths=[col_width] * 3, rowHeights=[3 * inch] * 3)
-        table.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 5),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 5),
-                    ("TOPPADDING", (0, 0), (-1, -1), 5),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
-                    ("BOX", (0, 0), (-1, -1), 1, colors.lightgrey),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.lightgrey),
-                ]
-            )
-        )
+        table.setStyle(CARD_PAGE_TABLE_STYLE)
 
         elements.append(table)
         return elements
 
     def _create_card_cell(
         self, saleable_card: SaleableCard, include_stats: bool, show_prices: bool
-    ) -> Table:
-        """Create cell content for a single card as a nested table"""
+    ) -> list[Flowable]:
+        """Create the stacked flowables shown in one grid cell"""
         card = saleable_card.card
-        cell_rows = []
+        cell: list[Flowable] = []
 
         if card.image_url:
-            image_path = self.cache.get_image(card.image_url, card.id)
-            if image_path and image_path.exists():
-                try:
-                    img = RLImage(str(image_path), width=1.5 * inch, height=2.1 * inch)
-                    cell_rows.append([img])
-                except Exception as e:
-                    self._warnings.append(
-                        f"Error loading image for {card.product_name}: {e}"
-                    )
+            img = self._images.get(card.image_url)
+            if img is None:
+                img = self._load_card_image(card, card.image_url)
+            if img is not None:
+                cell.append(img)
 
         name_text = f"<b>{card.card_name}</b>"
         if card.card_number:
             name_text += f" #{card.card_number}"
-        cell_rows.append([Paragraph(name_text, self.styles["CardName"])])
+        cell.append(Paragraph(name_text, CARD_NAME_STYLE))
 
-        cell_rows.append(
-            [Paragraph(f"<i>{card.console_name}</i>", self.styles["CardInfo"])]
-        )
+        cell.append(self._info_paragraph(f"<i>{card.console_name}</i>"))
 
         if saleable_card.quantity_for_sale > 1:
             qty_text = f"Disponibles: {saleable_card.quantity_for_sale}"
         else:
             qty_text = "Disponible: 1"
 
-        cell_rows.append([Paragraph(f"<b>{qty_text}</b>", self.styles["CardInfo"])])
+        cell.append(self._info_paragraph(f"<b>{qty_text}</b>"))
 
         if show_prices:
             price_text = f"${card.price_dollars:.2f}"
@@ -366,7 +427,7 @@ class PDFGenerator:
                 total = saleable_card.total_value
                 price_text += f" = <u>${total:.2f}</u>"
 
-            cell_rows.append([Paragraph(price_text, self.styles["CardPrice"])])
+            cell.append(Paragraph(price_text, CARD_PRICE_STYLE))
 
         if include_stats and card.stats:
             stats_text = []
@@ -378,25 +439,41 @@ class PDFGenerator:
                 stats_text.append(f"Rareza: {card.stats.rarity}")
 
             if stats_text:
-                cell_rows.append(
-                    [Paragraph(" | ".join(stats_text), self.styles["CardInfo"])]
-                )
+                cell.append(self._info_paragraph(" | ".join(stats_text)))
 
-        cell_table = Table(cell_rows, colWidths=[1.7 * inch])
-        cell_table.setStyle(
-            TableStyle(
-                [
-                    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-                    ("TOPPADDING", (0, 0), (-1, -1), 2),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-                ]
-            )
-        )
+        return cell
 
-        return cell_table
+    def _info_paragraph(self, text: str) -> Paragraph:
+        """
+        Info-line paragraph for text repeated across cards (set, quantity).
+        Grid cells all wrap at the same width, so one parsed Paragraph can be
+        drawn in every cell that shows the same text.
+        """
+        paragraph = self._paragraphs.get(text)
+        if paragraph is None:
+            paragraph = self._paragraphs[text] = Paragraph(text, CARD_INFO_STYLE)
+        return paragraph
+
+    def _load_card_image(self, card: Card, image_url: str) -> RLImage | None:
+        """Image flowable for a card, shared by cards with the same image URL"""
+        if card.id in self._image_paths:
+            image_path = self._image_paths[card.id]
+        else:
+            image_path = self.cache.get_image(image_url, card.id)
+        if not image_path or not image_path.exists():
+            return None
+        try:
+            img = RLImage(
+                str(self.cache.get_thumbnail(image_path)),
+                width=1.5 * inch,
+                height=2.1 * inch,
+                lazy=2,
+            )
+        except Exception as e:
+            self._warnings.append(f"Error loading image for {card.product_name}: {e}")
+            return None
+        self._images[image_url] = img
+        return img
 
     def _create_table_layout(
         self, saleable_cards: list[SaleableCard], show_prices: bool
@@ -452,80 +529,22 @@ class PDFGenerator:
 
         table = Table(table_data, colWidths=col_widths, repeatRows=1)
 
-        table_style = TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#D32F2F")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, 0), 11),
-                ("BOTTOMPADDING", (0, 0), (-1, 0), 14),
-                ("TOPPADDING", (0, 0), (-1, 0), 14),
-                ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-                ("TEXTCOLOR", (0, 1), (-1, -1), colors.HexColor("#212121")),
-                ("ALIGN", (0, 1), (0, -1), "CENTER"),
-                ("ALIGN", (-1, 1), (-1, -1), "CENTER"),
-                ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                ("FONTSIZE", (0, 1), (-1, -1), 9),
-                ("TOPPADDING", (0, 1), (-1, -1), 10),
-                ("BOTTOMPADDING", (0, 1), (-1, -1), 10),
-                ("LEFTPADDING", (0, 1), (-1, -1), 8),
-                ("RIGHTPADDING", (0, 1), (-1, -1), 8),
-                (
-                    "ROWBACKGROUNDS",
-                    (0, 1),
-                    (-1, -1),
-                    [colors.white, colors.HexColor("#FFEBEE")],
-                ),
-                ("BACKGROUND", (-1, 1), (-1, -1), colors.HexColor("#FFF3E0")),
-                ("TEXTCOLOR", (-1, 1), (-1, -1), colors.HexColor("#E65100")),
-                ("FONTNAME", (-1, 1), (-1, -1), "Helvetica-Bold"),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#BDBDBD")),
-                ("BOX", (0, 0), (-1, -1), 2, colors.HexColor("#D32F2F")),
-                ("LINEBELOW", (0, 0), (-1, 0), 2, colors.HexColor("#B71C1C")),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ]
-        )
-
-        table.setStyle(table_style)
+        table.setStyle(TABLE_LAYOUT_STYLE)
         elements.append(table)
 
         if not show_prices:
             elements.append(Spacer(1, 0.4 * inch))
 
-            footer_style = ParagraphStyle(
-                name="Footer",
-                parent=self.styles["Normal"],
-                fontSize=10,
-                textColor=colors.HexColor("#D32F2F"),
-                alignment=1,
-                leading=14,
-                fontName="Helvetica-Bold",
-            )
-
             footer_text = (
                 "💬 <b>¿Interesado en alguna carta?</b><br/>"
                 "Contáctanos para consultar precios y disponibilidad.<br/>"
                 "Todas las cartas están en excelente condición."
             )
 
-            footer_para = Paragraph(footer_text, footer_style)
+            footer_para = Paragraph(footer_text, FOOTER_STYLE)
 
             footer_table = Table([[footer_para]], colWidths=[6.5 * inch])
-            footer_table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#FFEBEE")),
-                        ("BOX", (0, 0), (-1, -1), 1.5, colors.HexColor("#D32F2F")),
-                        ("TOPPADDING", (0, 0), (-1, -1), 15),
-                        ("BOTTOMPADDING", (0, 0), (-1, -1), 15),
-                        ("LEFTPADDING", (0, 0), (-1, -1), 20),
-                        ("RIGHTPADDING", (0, 0), (-1, -1), 20),
-                        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                    ]
-                )
-            )
+            footer_table.setStyle(FOOTER_TABLE_STYLE)
 
             elements.append(footer_table)
 
@@ -1,11 +1,28 @@
 """Card data models"""
 
+import re
 from datetime import datetime
 from decimal import Decimal
+from functools import cached_property
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
+CARD_NUMBER_PATTERN = re.compile(r"-\s*(\d+)/\d+")
+CARD_NAME_PATTERN = re.compile(r"^(.+?)\s*-\s*\d+/\d+")
+CENTS_PER_DOLLAR = Decimal(100)
+
+
+def parse_entry_date(value: str) -> datetime:
+    """Parse a YYYY-MM-DD date, trying the C-level ISO parser first"""
+    # fromisoformat also takes times, offsets and week dates; only feed it YYYY-MM-DD
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.strptime(value, "%Y-%m-%d")
+
 
 class PokemonSet(BaseModel):
     """Represents a Pokémon TCG set"""
@@ -58,7 +75,7 @@ class Card(BaseModel):
         if isinstance(v, datetime):
             return v
         try:
-            return datetime.strptime(v, "%Y-%m-%d")
+            return parse_entry_date(v)
         except ValueError:
             return datetime.now()
 
@@ -67,14 +84,19 @@ class Card(BaseModel):
         """Get price in dollars"""
         if self.custom_price:
             return self.custom_price
-        return Decimal(self.price_in_pennies) / Decimal(100)
+        return Decimal(self.price_in_pennies) / CENTS_PER_DOLLAR
 
     @property
+    def price_cents(self) -> int | Decimal:
+        """Get price in cents (exact Decimal for custom prices, round when shown)"""
+        if self.custom_price:
+            return self.custom_price * CENTS_PER_DOLLAR
+        return self.price_in_pennies
+
+    @cached_property
     def card_number(self) -> str:
         """Extract card number from product name"""
-        import re
-
-        match = re.search(r"-\s*(\d+)/\d+", self.product_name)
+        match = CARD_NUMBER_PATTERN.search(self.product_name)
         if match:
             return match.group(1)
 
@@ -83,12 +105,10 @@ class Card(BaseModel):
 
         return ""
 
-    @property
+    @cached_property
     def card_name(self) -> str:
         """Extract clean card name without number"""
-        import re
-
-        match = re.match(r"^(.+?)\s*-\s*\d+/\d+", self.product_name)
+        match = CARD_NAME_PATTERN.match(self.product_name)
         if match:
             return match.group(1).strip()
 
@@ -97,6 +117,21 @@ class Card(BaseModel):
 
         return self.product_name
 
+    @cached_property
+    def card_name_lc(self) -> str:
+        """Lowercased card name, for case-insensitive sorting and matching"""
+        return self.card_name.lower()
+
+    @cached_property
+    def console_name_lc(self) -> str:
+        """Lowercased set name, for case-insensitive sorting and matching"""
+        return self.console_name.lower()
+
+    @cached_property
+    def product_name_lc(self) -> str:
+        """Lowercased product name, for case-insensitive matching"""
+        return self.product_name.lower()
+
     @property
     def is_saleable(self) -> bool:
         """Check if card has duplicates for sale"""
@@ -2,10 +2,12 @@
 
 from collections.abc import Iterator
 from decimal import Decimal
+from functools import cached_property
+from operator import attrgetter
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
-from poke_merkdo.models.card import Card
+from poke_merkdo.models.card import CENTS_PER_DOLLAR, Card
 
 
 class SaleableCard(BaseModel):
@@ -21,9 +23,15 @@ class SaleableCard(BaseModel):
 
 
 class Collection(BaseModel):
-    """Represents the entire card collection"""
+    """Represents the entire card collection
 
-    cards: list[Card]
+    The card tuple is frozen so the cached indexes below can never go stale;
+    build a new Collection to change which cards it holds.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    cards: tuple[Card, ...]
 
     def get_saleable_cards(self) -> list[SaleableCard]:
         """Get all cards with quantity >= 2 (keep 1, sell the rest)"""
@@ -31,44 +39,86 @@ class Collection(BaseModel):
 
     def get_cards_by_min_quantity(self, min_quantity: int = 2) -> list[SaleableCard]:
         """Get cards with quantity >= min_quantity"""
-        result = []
-        for card in self.cards:
-            if card.quantity >= min_quantity:
-                if min_quantity == 1:
-                    quantity_for_sale = card.quantity
-                else:
-                    quantity_for_sale = card.quantity - 1
-                result.append(
-                    SaleableCard(card=card, quantity_for_sale=quantity_for_sale)
-                )
-        return result
+        kept = 0 if min_quantity == 1 else 1
+        return [
+            SaleableCard(card=card, quantity_for_sale=card.quantity - kept)
+            for card in self.cards
+            if card.quantity >= min_quantity
+        ]
 
     def get_cards_by_set(self, set_name: str) -> list[Card]:
         """Filter cards by set name"""
-        return [c for c in self.cards if c.console_name == set_name]
+        return list(self.cards_by_set.get(set_name, ()))
+
+    @cached_property
+    def cards_by_set(self) -> dict[str, list[Card]]:
+        """Cards grouped by set name, built on first use"""
+        index: dict[str, list[Card]] = {}
+        for card in self.cards:
+            index.setdefault(card.console_name, []).append(card)
+        return index
+
+    @cached_property
+    def cards_by_set_lc(self) -> dict[str, list[Card]]:
+        """Cards grouped by lowercased set name, built on first use"""
+        index: dict[str, list[Card]] = {}
+        for card in self.cards:
+            index.setdefault(card.console_name_lc, []).append(card)
+        return index
+
+    def get_cards_by_set_contains(self, text: str) -> list[Card]:
+        """Cards whose set name contains text (case-insensitive)"""
+        needle = text.lower()
+        matched = [name for name in self.cards_by_set_lc if needle in name]
+        if len(matched) == 1:
+            return list(self.cards_by_set_lc[matched[0]])
+        matched_sets = set(matched)
+        return [c for c in self.cards if c.console_name_lc in matched_sets]
 
     def get_unique_sets(self) -> list[str]:
         """Get list of unique set names"""
-        return sorted(set(c.console_name for c in self.cards))
+        return sorted(self.cards_by_set)
 
     def total_cards(self) -> int:
         """Total number of cards (counting duplicates)"""
-        return sum(c.quantity for c in self.cards)
+        return sum(map(attrgetter("quantity"), self.cards))
 
     def total_unique_cards(self) -> int:
         """Total number of unique cards"""
         return len(self.cards)
 
+    def total_saleable_unique_cards(self) -> int:
+        """Number of distinct cards with copies for sale"""
+        return sum(1 for c in self.cards if c.quantity >= 2)
+
     def total_saleable_cards(self) -> int:
         """Total number of cards available for sale"""
-        return sum(c.quantity_for_sale for c in self.get_saleable_cards())
+        return sum(c.quantity - 1 for c in self.cards if c.quantity >= 2)
 
     def total_collection_value(self) -> Decimal:
         """Total value of all saleable cards"""
-        saleable = self.get_saleable_cards()
-        if not saleable:
-            return Decimal(0)
-        return sum((c.total_value for c in saleable), Decimal(0))
+        cents = 0
+        custom = Decimal(0)
+        for card in self.cards:
+            if card.quantity >= 2:
+                if card.custom_price:
+                    custom += card.custom_price * (card.quantity - 1)
+                else:
+                    cents += card.price_in_pennies * (card.quantity - 1)
+        return custom + Decimal(cents) / CENTS_PER_DOLLAR
+
+    def total_card_cents(self) -> int | Decimal:
+        """Total value of one copy of every card, in cents (exact, unrounded)"""
+        cents = 0
+        custom = Decimal(0)
+        for card in self.cards:
+            if card.custom_price:
+                custom += card.custom_price
+            else:
+                cents += card.price_in_pennies
+        if not custom:
+            return cents
+        return cents + custom * CENTS_PER_DOLLAR
 
     def __iter__(self) -> Iterator[Card]:  # type: ignore[override]
         return iter(self.cards)
@@ -1,11 +1,46 @@
 """CSV parser for collection data"""
 
 from datetime import datetime
+from itertools import repeat
+from math import isnan
 from pathlib import Path
+from typing import Any
 
-from pandas import DataFrame, Series, isna, read_csv
+from pandas import DataFrame, read_csv
 
 from poke_merkdo.models import Card, Collection
+from poke_merkdo.models.card import parse_entry_date
+
+# Columns read from the CSV, with the default used when a column is absent
+COLUMN_DEFAULTS: dict[str, Any] = {
+    "id": None,
+    "product-name": None,
+    "console-name": None,
+    "price-in-pennies": 0,
+    "condition-string": "Normal wear",
+    "quantity": 1,
+    "date-entered": "",
+    "sku": None,
+    "notes": None,
+}
+TEXT_COLUMNS = (
+    "id",
+    "product-name",
+    "console-name",
+    "condition-string",
+    "date-entered",
+    "sku",
+    "notes",
+)
+# Columns every row needs; without them no card can be built
+REQUIRED_COLUMNS = ("id", "product-name", "console-name")
+# Text columns whose empty cells become None instead of NaN
+OPTIONAL_COLUMNS = ("sku", "notes")
+
+
+def _is_missing(value: Any) -> bool:
+    """True for empty CSV cells (NaN after read_csv)"""
+    return value is None or (isinstance(value, float) and isnan(value))
 
 
 class CSVParser:
@@ -14,63 +49,107 @@ class CSVParser:
     def __init__(self, csv_path: Path):
         self.csv_path = csv_path
 
-    def parse(self) -> Collection:
-        """Parse CSV file into Collection object"""
-        df = read_csv(self.csv_path)
+    def parse(self, set_filter: str | None = None) -> Collection:
+        """
+        Parse CSV file into Collection object.
+        With set_filter, only rows whose set name contains it (any case)
+        are turned into cards.
+        """
+        rows = self._read_rows()
+        if set_filter:
+            needle = set_filter.lower()
+            rows = [row for row in rows if needle in str(row[2]).lower()]
 
         cards: list[Card] = []
-        for _, row in df.iterrows():
+        parsed_at = datetime.now()
+        for record in rows:
             try:
-                card = self._parse_row(row)
-                cards.append(card)
+                cards.append(self._parse_record(*record, fallback_date=parsed_at))
             except Exception as e:
-                print(f"Warning: Failed to parse row {row.get('id', 'unknown')}: {e}")
+                card_id = "unknown" if _is_missing(record[0]) else record[0]
+                print(f"Warning: Failed to parse row {card_id}: {e}")
                 continue
 
-        return Collection(cards=cards)
+        return Collection.model_construct(cards=tuple(cards))
+
+    def _read_rows(self) -> list[tuple[Any, ...]]:
+        """Read the CSV in one bulk C-engine pass into plain row tuples"""
+        df = read_csv(
+            self.csv_path,
+            engine="c",
+            usecols=lambda column: column in COLUMN_DEFAULTS,
+            dtype={column: str for column in TEXT_COLUMNS},
+        )
+        missing = [column for column in REQUIRED_COLUMNS if column not in df]
+        if missing:
+            print(
+                f"Warning: Failed to parse {self.csv_path.name}: "
+                f"missing required columns {', '.join(missing)}"
+            )
+            return []
 
-    def _parse_row(self, row: Series) -> Card:
-        """Parse a single CSV row into Card object"""
-        date_str = str(row.get("date-entered", ""))
+        for column in OPTIONAL_COLUMNS:
+            if column in df:
+                values = df[column].astype(object)
+                df[column] = values.where(values.notna(), None)
+        columns = [
+            df[column].tolist() if column in df else repeat(default)
+            for column, default in COLUMN_DEFAULTS.items()
+        ]
+        return list(zip(*columns)) if len(df) else []
+
+    def _parse_record(
+        self,
+        card_id: Any,
+        product_name: Any,
+        console_name: Any,
+        price_in_pennies: Any,
+        condition: Any,
+        quantity: Any,
+        date_str: Any,
+        sku: Any,
+        notes: Any,
+        *,
+        fallback_date: datetime,
+    ) -> Card:
+        """Build a Card from one row of CSV values"""
         try:
-            date_entered = datetime.strptime(date_str, "%Y-%m-%d")
+            date_entered = parse_entry_date(str(date_str))
         except ValueError:
-            date_entered = datetime.now()
+            date_entered = fallback_date
 
         return Card(
-            id=str(row["id"]),
-            product_name=str(row["product-name"]),
-            console_name=str(row["console-name"]),
-            price_in_pennies=int(row.get("price-in-pennies", 0)),
-            condition=str(row.get("condition-string", "Normal wear")),
-            quantity=int(row.get("quantity", 1)),
+            id=str(card_id),
+            product_name=str(product_name),
+            console_name=str(console_name),
+            price_in_pennies=int(price_in_pennies),
+            condition=str(condition),
+            quantity=int(quantity),
             date_entered=date_entered,
-            sku=str(row.get("sku", "")) if not isna(row.get("sku")) else None,
-            notes=str(row.get("notes", "")) if not isna(row.get("notes")) else None,
+            sku=sku,
+            notes=notes,
         )
 
     def export_to_csv(self, collection: Collection, output_path: Path) -> None:
         """Export collection back to CSV format"""
-        data = []
-        for card in collection.cards:
-            data.append(
-                {
-                    "id": card.id,
-                    "product-name": card.product_name,
-                    "console-name": card.console_name,
-                    "price-in-pennies": card.price_in_pennies,
-                    "include-string": "Ungraded",
-                    "condition-string": card.condition,
-                    "sku": card.sku or "",
-                    "notes": card.notes or "",
-                    "cost-basis-in-pennies": 0,
-                    "quantity": card.quantity,
-                    "date-entered": card.date_entered.strftime("%Y-%m-%d"),
-                    "grading-company": "",
-                    "grading-cert-id": "",
-                    "folder": "",
-                }
-            )
+        cards = collection.cards
+        blank = [""] * len(cards)
+        columns = {
+            "id": [card.id for card in cards],
+            "product-name": [card.product_name for card in cards],
+            "console-name": [card.console_name for card in cards],
+            "price-in-pennies": [card.price_in_pennies for card in cards],
+            "include-string": ["Ungraded"] * len(cards),
+            "condition-string": [card.condition for card in cards],
+            "sku": [card.sku or "" for card in cards],
+            "notes": [card.notes or "" for card in cards],
+            "cost-basis-in-pennies": [0] * len(cards),
+            "quantity": [card.quantity for card in cards],
+            "date-entered": [card.date_entered.strftime("%Y-%m-%d") for card in cards],
+            "grading-company": blank,
+            "grading-cert-id": blank,
+            "folder": blank,
+        }
 
-        df = DataFrame(data)
-        df.to_csv(output_path, index=False)
+        df = DataFrame(columns)
+        df.to_csv(output_path, index=False, chunksize=10_000, lineterminator="\n")